@@ -0,0 +1,299 @@
+"""Benchmark the reminder tick and the /api/* endpoints against synthetic data.
+
+Seeds users, medicines, logs and notifications into a local database, then
+reports tick duration, per-endpoint latency percentiles and SQL query counts
+as JSON so runs can be compared between commits:
+
+    python benchmark.py --scale 1k --output before.json
+    python benchmark.py --scale 1k --output after.json --baseline before.json
+    python benchmark.py --scale 100k --tick-workers 1,2,4,8   # parallel tick speedup
+
+Point BENCH_DATABASE_URL at a local Postgres to benchmark against it; the
+default is a throwaway SQLite file in the temp directory. The database is
+wiped and reseeded.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SCALES = {'1k': 1_000, '100k': 100_000, '1m': 1_000_000}
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+parser.add_argument('--scale', choices=SCALES, default='1k', help='number of medicines to seed')
+parser.add_argument('--requests', type=int, default=200, help='requests per endpoint')
+parser.add_argument('--ticks', type=int, default=5, help='scheduler ticks to time')
+parser.add_argument('--tick-workers', default='1',
+                    help='comma-separated SCHEDULER_TICK_WORKERS values to time the tick with, e.g. 1,2,4')
+parser.add_argument('--cache', action='store_true', help='leave the response cache on (default: measure cold DB paths)')
+parser.add_argument('--output', default='benchmark_results.json')
+parser.add_argument('--baseline', help='earlier results file to compare against')
+parser.add_argument('--seed', type=int, default=42)
+args = parser.parse_args()
+
+# The app reads its configuration at import time
+# A relative sqlite:/// path would land in Flask's instance/ folder, so use an absolute temp path
+os.environ['DATABASE_URL'] = os.environ.get(
+    'BENCH_DATABASE_URL', 'sqlite:///' + os.path.join(tempfile.gettempdir(), 'medicine-benchmark.db'))
+os.environ['SCHEDULER_MODE'] = 'off'
+if not args.cache:
+    os.environ['RESPONSE_CACHE_SIZE'] = '0'
+
+import app as medicine_app
+from app import (app, db, User, Medicine, MedicineLog, Notification, MedicineSlot,
+                 ReminderDispatch, minute_to_24h, rebuild_stat_counters)
+from sqlalchemy import event
+
+CHUNK = 10_000
+STATUSES = ['Taken'] * 8 + ['Missed'] * 2
+SLOT_CHOICES = [480, 540, 720, 840, 1080, 1200, 1260]  # common dosing times
+
+query_count = [0]
+
+
+def chunked_insert(model, rows):
+    """Insert an iterable of row dicts CHUNK at a time, so the 1m scale never holds them all"""
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, CHUNK))
+        if not batch:
+            break
+        db.session.execute(db.insert(model), batch)
+    db.session.commit()
+
+
+def seed(medicine_count):
+    """Wipe the database and insert a synthetic population; returns user ids"""
+    rng = random.Random(args.seed)
+    db.drop_all()
+    db.create_all()
+
+    user_count = max(1, medicine_count // 5)
+    password = 'bench'  # never hashed: benchmark sessions are set directly
+    chunked_insert(User, (
+        {'username': f'user{i}', 'email': f'user{i}@bench.local', 'password': password, 'role': 'user'}
+        for i in range(user_count)
+    ))
+    user_ids = [row[0] for row in db.session.query(User.id)]
+
+    now = datetime.utcnow()
+
+    def medicines():
+        for i in range(medicine_count):
+            slot_minutes = sorted(rng.sample(SLOT_CHOICES, rng.randint(1, 3)))
+            yield {
+                'user_id': user_ids[i % user_count],
+                'medicine_name': f'Medicine {i}',
+                'dosage': f'{rng.choice([5, 10, 20, 50])}mg',
+                'frequency': 'daily',
+                'times_per_day': len(slot_minutes),
+                'specific_times': json.dumps([minute_to_24h(m) for m in slot_minutes]),
+                'schedule_minutes': slot_minutes,
+                'start_date': (now - timedelta(days=90)).strftime('%Y-%m-%d'),
+                'status': 'Active' if rng.random() < 0.9 else 'Paused',
+                'priority': rng.choice(['Low', 'Medium', 'High', 'Critical']),
+                'created_at': now - timedelta(minutes=i)
+            }
+    chunked_insert(Medicine, medicines())
+
+    # Slots, logs and notifications follow the medicines one page of ids at a time
+    last_id = 0
+    while True:
+        rows = db.session.query(Medicine.id, Medicine.user_id, Medicine.schedule_minutes, Medicine.status).filter(
+            Medicine.id > last_id
+        ).order_by(Medicine.id).limit(CHUNK).all()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        chunked_insert(MedicineSlot, (
+            {'medicine_id': medicine_id, 'user_id': user_id, 'slot_minute': m, 'slot_time': minute_to_24h(m)}
+            for medicine_id, user_id, slot_minutes, status in rows if status == 'Active'
+            for m in slot_minutes
+        ))
+
+        # Three logs and three notifications per medicine, spread over 90 days
+        logs, notifications = [], []
+        for medicine_id, user_id, slot_minutes, _ in rows:
+            for _ in range(3):
+                at = now - timedelta(minutes=rng.randint(0, 90 * 24 * 60))
+                logs.append({
+                    'user_id': user_id, 'medicine_id': medicine_id, 'taken_time': at,
+                    'scheduled_time': minute_to_24h(slot_minutes[0]), 'status': rng.choice(STATUSES)
+                })
+                notifications.append({
+                    'user_id': user_id, 'medicine_id': medicine_id, 'message': f'Time to take medicine {medicine_id}',
+                    'type': 'reminder', 'is_read': rng.random() < 0.8, 'created_at': at
+                })
+        chunked_insert(MedicineLog, logs)
+        chunked_insert(Notification, notifications)
+
+    with db.engine.begin() as connection:
+        rebuild_stat_counters(connection)
+    return user_ids
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        'p50_ms': round(pick(0.50) * 1000, 3),
+        'p95_ms': round(pick(0.95) * 1000, 3),
+        'p99_ms': round(pick(0.99) * 1000, 3),
+        'mean_ms': round(statistics.mean(samples) * 1000, 3),
+    }
+
+
+def bench_tick(workers=1):
+    """Time check_medicine_reminders for the busiest slot minute on `workers` processes"""
+    busiest = db.session.query(MedicineSlot.slot_minute, db.func.count()).group_by(
+        MedicineSlot.slot_minute
+    ).order_by(db.func.count().desc()).first()[0]
+    today = datetime.utcnow().date()
+
+    medicine_app.close_tick_pool()
+    medicine_app.SCHEDULER_TICK_WORKERS = workers
+    medicine_app.SCHEDULER_TICK_PARTITIONS = 4 * workers
+
+    samples, queries = [], []
+    for i in range(args.ticks + (workers > 1)):
+        ReminderDispatch.query.delete()
+        db.session.commit()
+        before = query_count[0]
+        started = time.perf_counter()
+        if medicine_app.check_medicine_reminders({busiest: today}) is None:
+            raise SystemExit(f'tick with {workers} worker(s) failed')
+        if workers > 1 and i == 0:
+            continue  # untimed: starts the worker processes
+        samples.append(time.perf_counter() - started)
+        queries.append(query_count[0] - before)
+    medicine_app.close_tick_pool()
+
+    due = MedicineSlot.query.filter_by(slot_minute=busiest).count()
+    # Worker processes' queries aren't counted here, only the coordinator's
+    return {'slot_minute': busiest, 'due_slots': due, 'workers': workers, 'queries': max(queries), **summarize(samples)}
+
+
+def bench_endpoints(user_ids):
+    rng = random.Random(args.seed)
+    client = app.test_client()
+    endpoints = [
+        ('GET', '/api/user_medicines', None),
+        ('GET', '/api/stats', None),
+        ('GET', '/api/upcoming_reminders', None),
+        ('GET', '/api/medicine_history', None),
+        ('GET', '/api/user_notifications', None),
+        ('GET', '/api/adherence_history', None),
+        ('GET', '/api/adherence_analytics', None),
+        ('POST', '/api/log_medicine', 'log'),
+    ]
+    medicine_for_user = dict(db.session.query(Medicine.user_id, db.func.min(Medicine.id)).group_by(Medicine.user_id))
+    db.session.close()
+
+    results = {}
+    for method, path, body in endpoints:
+        samples, queries = [], []
+        for _ in range(args.requests):
+            user_id = rng.choice(user_ids)
+            with client.session_transaction() as sess:
+                sess['user_id'] = user_id
+                sess['role'] = 'user'
+            payload = {'medicine_id': medicine_for_user[user_id], 'scheduled_time': '08:00'} if body == 'log' else None
+
+            before = query_count[0]
+            started = time.perf_counter()
+            response = client.open(path, method=method, json=payload)
+            samples.append(time.perf_counter() - started)
+            queries.append(query_count[0] - before)
+            if response.status_code != 200 or not response.get_json().get('success'):
+                raise SystemExit(f'{method} {path} failed: {response.get_data(as_text=True)[:200]}')
+
+        results[f'{method} {path}'] = {'queries': max(queries), **summarize(samples)}
+    return results
+
+
+def compare(results, baseline_path):
+    """Print p95 and query-count changes against an earlier results file"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    rows = [('tick', baseline['tick'], results['tick'])]
+    rows += [(name, baseline['endpoints'][name], stats)
+             for name, stats in results['endpoints'].items() if name in baseline['endpoints']]
+    print(f"\nvs {baseline_path} ({(baseline.get('commit') or '?')[:8]})")
+    for name, old, new in rows:
+        change = (new['p95_ms'] - old['p95_ms']) / old['p95_ms'] * 100 if old['p95_ms'] else 0
+        print(f"  {name:40} p95 {old['p95_ms']:>9.2f} -> {new['p95_ms']:>9.2f} ms ({change:+.0f}%)"
+              f"  queries {old['queries']} -> {new['queries']}")
+
+
+def main():
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], text=True, stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).strip()
+    except Exception:
+        commit = None
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda *_: query_count.__setitem__(0, query_count[0] + 1))
+
+        tick_workers = [int(workers) for workers in args.tick_workers.split(',')]
+        if max(tick_workers) > 1 and db.engine.dialect.name != 'postgresql':
+            raise SystemExit('--tick-workers above 1 needs BENCH_DATABASE_URL pointing at Postgres')
+        if max(tick_workers) > (os.cpu_count() or 1):
+            print(f"⚠️  Only {os.cpu_count()} CPU(s): tick workers beyond that share cores, so expect no speedup")
+
+        print(f"🌱 Seeding {args.scale} medicines into {db.engine.url.render_as_string(hide_password=True)}")
+        started = time.perf_counter()
+        user_ids = seed(SCALES[args.scale])
+        seed_seconds = round(time.perf_counter() - started, 2)
+
+        print("⏱  Timing scheduler tick")
+        tick_scaling = [bench_tick(workers) for workers in tick_workers]
+        tick = tick_scaling[0]
+        for result in tick_scaling:
+            result['speedup'] = round(tick['p50_ms'] / result['p50_ms'], 2)
+        print("⏱  Timing endpoints")
+        endpoints = bench_endpoints(user_ids)
+
+        results = {
+            'commit': commit,
+            'timestamp': datetime.utcnow().isoformat(),
+            'database': db.engine.dialect.name,
+            'cpus': os.cpu_count(),
+            'scale': args.scale,
+            'medicines': SCALES[args.scale],
+            'users': len(user_ids),
+            'requests_per_endpoint': args.requests,
+            'response_cache': args.cache,
+            'seed_seconds': seed_seconds,
+            'tick': tick,
+            'tick_scaling': tick_scaling,
+            'endpoints': endpoints,
+        }
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\ntick: {tick}")
+    if len(tick_scaling) > 1:
+        for result in tick_scaling:
+            print(f"  {result['workers']:>2} worker(s): p50 {result['p50_ms']:>9.2f} ms  speedup x{result['speedup']}")
+    for name, stats in endpoints.items():
+        print(f"{name:40} {stats}")
+    print(f"\n✅ Results written to {args.output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
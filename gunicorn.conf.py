@@ -0,0 +1,12 @@
+"""Gunicorn settings, loaded with `gunicorn --config gunicorn.conf.py app:app`"""
+
+
+def post_fork(server, worker):
+    """Start the worker's background services as soon as it is forked.
+
+    The app is preloaded in the master, which never starts threads. Starting
+    them here instead of on a worker's first request means reminders fire
+    after a deploy or restart even if nobody has visited the site yet.
+    """
+    from app import start_background_services
+    start_background_services()
@@ -2,6 +2,10 @@
 let currentUser = null;
 let notificationSound = null;
 let reminderInterval = null;
+let reminderStream = null;
+let notificationCursor = null;  // last notification id seen by /api/sync_notifications
+let knownNotifications = {};  // notification id -> notification, from syncs and the stream
+let notificationSync = null;  // in-flight syncNotifications() promise, shared by overlapping callers
 
 // Initialize app
 document.addEventListener('DOMContentLoaded', function() {
@@ -156,18 +160,19 @@ function stopAlarmSound() {
 
 // Start checking for reminders
 function startReminderChecking() {
-    // Check every 30 seconds for due reminders
-    reminderInterval = setInterval(async () => {
-        if (currentUser) {
-            await checkDueReminders();
-            updateMedicineCountdowns(); // Update countdowns every minute
-        }
-    }, 30000); // Check every 30 seconds
+    // Browsers without EventSource fall back to polling every 30 seconds
+    if (!('EventSource' in window)) {
+        reminderInterval = setInterval(async () => {
+            if (currentUser) {
+                await checkDueReminders();
+            }
+        }, 30000);
+    }
     
     // Also check immediately
     if (currentUser) {
         setTimeout(() => {
-            checkDueReminders();
+            startReminderStream();
             updateMedicineCountdowns();
         }, 2000);
     }
@@ -180,28 +185,91 @@ function startReminderChecking() {
     }, 30000);
 }
 
-// Check for due reminders
+// Open the server push stream for new reminders (no-op if already open)
+function startReminderStream() {
+    // The first sync sets the cursor and the badge, with or without EventSource
+    if (notificationCursor === null) {
+        checkDueReminders();
+    }
+    if (!('EventSource' in window) || reminderStream) return;
+    
+    // Each response carries at most one batch; the browser reconnects on its
+    // own and resumes after the last event id
+    reminderStream = new EventSource('/api/reminder_stream');
+    reminderStream.addEventListener('reminders', async (event) => {
+        const reminders = JSON.parse(event.data);
+        reminders.forEach(n => { knownNotifications[n.id] = n; });
+        await showDueReminders(reminders);
+        // The batch isn't the unread count: sync for it (and advance the cursor)
+        await syncNotifications();
+    });
+    reminderStream.onerror = () => {
+        if (!currentUser) {
+            stopReminderStream();
+        }
+    };
+}
+
+function stopReminderStream() {
+    if (reminderStream) {
+        reminderStream.close();
+        reminderStream = null;
+    }
+}
+
+// Show alarms for reminders that haven't been shown in this tab yet
+async function showDueReminders(reminders) {
+    const shownIds = [];
+    for (const notification of reminders) {
+        if (!sessionStorage.getItem(`alarm_shown_${notification.id}`)) {
+            showMedicineAlarm(notification);
+            sessionStorage.setItem(`alarm_shown_${notification.id}`, 'true');
+            shownIds.push(notification.id);
+        }
+    }
+    
+    // Mark them all as read after showing, in one request
+    if (shownIds.length > 0) {
+        await markNotificationsAsRead(shownIds);
+    }
+}
+
+// Fetch notifications newer than the cursor into knownNotifications and set
+// the badge from the server's unread count; returns the new notifications
+function syncNotifications() {
+    if (!notificationSync) {
+        notificationSync = pullNotifications().finally(() => { notificationSync = null; });
+    }
+    return notificationSync;
+}
+
+async function pullNotifications() {
+    const fresh = [];
+    let data;
+    do {
+        const url = notificationCursor === null
+            ? '/api/sync_notifications'
+            : `/api/sync_notifications?after_id=${notificationCursor}`;
+        const response = await fetch(url);
+        data = await response.json();
+        if (!data.success) return fresh;
+        
+        notificationCursor = data.last_id;
+        data.notifications.forEach(n => { knownNotifications[n.id] = n; });
+        fresh.push(...data.notifications);
+    } while (data.has_more);
+    
+    updateNotificationBadge(data.unread_count);
+    return fresh;
+}
+
+// Check for due reminders: only notifications newer than the last sync come back
 async function checkDueReminders() {
     try {
-        const response = await fetch('/api/user_notifications');
-        const data = await response.json();
+        const fresh = await syncNotifications();
         
-        if (data.success) {
-            const unreadNotifications = data.notifications.filter(n => !n.is_read && n.type === 'reminder');
-            
-            // Check for new notifications to show as alarms
-            for (const notification of unreadNotifications) {
-                if (!sessionStorage.getItem(`alarm_shown_${notification.id}`)) {
-                    showMedicineAlarm(notification);
-                    sessionStorage.setItem(`alarm_shown_${notification.id}`, 'true');
-                    
-                    // Mark as read after showing
-                    await markNotificationAsRead(notification.id);
-                }
-            }
-            
-            updateNotificationBadge(unreadNotifications.length);
-        }
+        // Check for new notifications to show as alarms
+        await showDueReminders(fresh.filter(n => !n.is_read && n.type === 'reminder'));
     } catch (error) {
         console.error('Error checking reminders:', error);
     }
@@ -325,6 +393,9 @@ async function handleAlarmAction(action, notificationId) {
 }
 
 async function getMedicineIdFromNotification(notificationId) {
+    if (knownNotifications[notificationId]) {
+        return knownNotifications[notificationId].medicine_id;
+    }
     try {
         const response = await fetch('/api/user_notifications');
         const data = await response.json();
@@ -740,6 +811,9 @@ async function logout() {
         
         if (data.success) {
             currentUser = null;
+            notificationCursor = null;
+            knownNotifications = {};
+            stopReminderStream();
             showScreen('login-screen');
             showSnackbar('Logged out successfully!');
         }
@@ -753,7 +827,42 @@ function requestNotificationPermission() {
     if ('Notification' in window && Notification.permission === 'default') {
         Notification.requestPermission().then(permission => {
             console.log('Notification permission:', permission);
+            if (permission === 'granted') {
+                subscribeToPush();
+            }
+        });
+    } else if ('Notification' in window && Notification.permission === 'granted') {
+        subscribeToPush();
+    }
+}
+
+// Register this browser for server-sent Web Push reminders (when enabled)
+async function subscribeToPush() {
+    if (!('serviceWorker' in navigator) || !('PushManager' in window)) return;
+    
+    try {
+        const keyResponse = await fetch('/api/push_public_key');
+        const keyData = await keyResponse.json();
+        if (!keyData.success) return;
+        
+        const registration = await navigator.serviceWorker.ready;
+        let subscription = await registration.pushManager.getSubscription();
+        if (!subscription) {
+            const padding = '='.repeat((4 - keyData.public_key.length % 4) % 4);
+            const rawKey = atob((keyData.public_key + padding).replace(/-/g, '+').replace(/_/g, '/'));
+            subscription = await registration.pushManager.subscribe({
+                userVisibleOnly: true,
+                applicationServerKey: Uint8Array.from(rawKey, c => c.charCodeAt(0))
+            });
+        }
+        
+        await fetch('/api/push_subscription', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(subscription.toJSON())
         });
+    } catch (error) {
+        console.log('Push subscription failed:', error);
     }
 }
 
@@ -762,6 +871,7 @@ async function loadUserDashboard() {
     if (!currentUser) return;
     
     document.getElementById('user-name').textContent = currentUser.username;
+    startReminderStream();
     await loadStats();
     await loadUserMedicines();
     await loadUpcomingReminders();
@@ -921,17 +1031,71 @@ async function logMedicineMissed(medicineId) {
     }
 }
 
+// Record reads locally so the panel and badge match the server without a refetch
+function applyNotificationsRead(notificationIds, unreadCount) {
+    notificationIds.forEach(id => {
+        if (knownNotifications[id]) knownNotifications[id].is_read = true;
+        document.querySelectorAll(`.notification-card[data-notification-id="${id}"]`)
+            .forEach(card => card.classList.replace('unread', 'read'));
+    });
+    updateNotificationBadge(unreadCount);
+}
+
 async function markNotificationAsRead(notificationId) {
     try {
         const response = await fetch(`/api/mark_notification_read/${notificationId}`, {
             method: 'POST'
         });
-        return await response.json();
+        const data = await response.json();
+        if (data.success) {
+            applyNotificationsRead([notificationId], data.unread_count);
+        }
+        return data;
     } catch (error) {
         console.error('Failed to mark notification as read:', error);
     }
 }
 
+async function markAllNotificationsAsRead(upToId, button) {
+    try {
+        const response = await fetch('/api/mark_all_notifications_read', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ up_to_id: upToId })
+        });
+        const data = await response.json();
+        if (data.success) {
+            const readIds = Object.keys(knownNotifications).map(Number).filter(id => id <= upToId);
+            applyNotificationsRead(readIds, data.unread_count);
+            if (button) closeModal(button);
+        }
+        return data;
+    } catch (error) {
+        console.error('Failed to mark all notifications as read:', error);
+    }
+}
+
+async function markNotificationsAsRead(notificationIds) {
+    try {
+        const response = await fetch('/api/mark_notifications_read', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ ids: notificationIds })
+        });
+        const data = await response.json();
+        if (data.success) {
+            applyNotificationsRead(notificationIds, data.unread_count);
+        }
+        return data;
+    } catch (error) {
+        console.error('Failed to mark notifications as read:', error);
+    }
+}
+
 // Update the showNotificationsScreen function
 function showNotificationsScreen() {
     loadNotifications();
@@ -939,12 +1103,15 @@ function showNotificationsScreen() {
 
 async function loadNotifications() {
     try {
-        const response = await fetch('/api/user_notifications');
-        const data = await response.json();
+        // Only what arrived since the last sync is fetched
+        await syncNotifications();
+        const notifications = Object.values(knownNotifications)
+            .sort((a, b) => b.id - a.id)
+            .slice(0, 20);
         
-        if (data.success && data.notifications.length > 0) {
+        if (notifications.length > 0) {
             // Create notifications modal
-            showNotificationsModal(data.notifications);
+            showNotificationsModal(notifications);
         } else {
             showSnackbar('No notifications', 'info');
         }
@@ -963,7 +1130,7 @@ function showNotificationsModal(notifications) {
             </div>
             <div class="notifications-container">
                 ${notifications.map(notification => `
-                    <div class="notification-card ${notification.is_read ? 'read' : 'unread'}">
+                    <div class="notification-card ${notification.is_read ? 'read' : 'unread'}" data-notification-id="${notification.id}">
                         <div class="notification-header">
                             <div class="notification-message">${notification.message}</div>
                             <div class="notification-time">${notification.created_at}</div>
@@ -977,6 +1144,9 @@ function showNotificationsModal(notifications) {
                 `).join('')}
             </div>
             <div class="alarm-actions">
+                <button class="btn btn-primary" onclick="markAllNotificationsAsRead(${notifications[0].id}, this)">
+                    <i class="fas fa-check-double"></i> Mark All Read
+                </button>
                 <button class="btn btn-secondary" onclick="closeModal(this)">
                     <i class="fas fa-times"></i> Close
                 </button>
@@ -999,15 +1169,16 @@ function showMedicineHistory() {
     loadMedicineHistory();
 }
 
-async function loadMedicineHistory() {
+async function loadMedicineHistory(cursor = null) {
     try {
-        const response = await fetch('/api/medicine_history');
+        const url = cursor ? `/api/medicine_history?cursor=${encodeURIComponent(cursor)}` : '/api/medicine_history';
+        const response = await fetch(url);
         const data = await response.json();
         
         const historyList = document.getElementById('history-list');
         
         if (data.success && data.history.length > 0) {
-            historyList.innerHTML = data.history.map(log => `
+            const historyHtml = data.history.map(log => `
                 <div class="history-card">
                     <div class="history-header">
                         <span class="history-medicine">${log.medicine_name}</span>
@@ -1033,7 +1204,25 @@ async function loadMedicineHistory() {
                     </div>
                 </div>
             `).join('');
-        } else {
+            
+            // Older pages are appended below, replacing the previous "Load more" button
+            const loadMoreButton = document.getElementById('history-load-more');
+            if (loadMoreButton) {
+                loadMoreButton.remove();
+            }
+            if (cursor) {
+                historyList.insertAdjacentHTML('beforeend', historyHtml);
+            } else {
+                historyList.innerHTML = historyHtml;
+            }
+            if (data.next_cursor) {
+                historyList.insertAdjacentHTML('beforeend', `
+                    <button id="history-load-more" class="btn btn-secondary" onclick="loadMedicineHistory('${data.next_cursor}')">
+                        <i class="fas fa-chevron-down"></i> Load more
+                    </button>
+                `);
+            }
+        } else if (!cursor) {
             historyList.innerHTML = `
                 <div style="text-align: center; padding: 40px 20px; color: #64748b;">
                     <i class="fas fa-history" style="font-size: 48px; margin-bottom: 16px; opacity: 0.5;"></i>
@@ -1206,6 +1395,8 @@ function toggleDropdown() {
 async function loadAdminDashboard() {
     if (!currentUser || currentUser.role !== 'admin') return;
     
+    startReminderStream();
+    
     const adminContainer = document.querySelector('.admin-container');
     adminContainer.innerHTML = `
         <div class="screen-header">
@@ -1,11 +1,12 @@
 // sw.js
 const CACHE_NAME = 'medicine-reminder-v1';
+// Flask serves these from /static/; one 404 here fails install and the
+// worker never activates, so push subscriptions never get made
 const urlsToCache = [
   '/',
-  '/index.html',
-  '/style.css',
-  '/script.js',
-  '/manifest.json'
+  '/static/style.css',
+  '/static/script.js',
+  '/static/manifest.json'
 ];
 
 self.addEventListener('install', function(event) {
@@ -17,16 +18,17 @@ self.addEventListener('install', function(event) {
   );
 });
 
+// Network first so a deploy reaches open tabs; the cache only covers offline.
+// API calls (and the reminder stream) go straight to the network.
 self.addEventListener('fetch', function(event) {
+  const url = new URL(event.request.url);
+  if (event.request.method !== 'GET' || url.pathname.startsWith('/api/')) {
+    return;
+  }
   event.respondWith(
-    caches.match(event.request)
-      .then(function(response) {
-        if (response) {
-          return response;
-        }
-        return fetch(event.request);
-      }
-    )
+    fetch(event.request).catch(function() {
+      return caches.match(event.request);
+    })
   );
 });
 
@@ -0,0 +1,61 @@
+"""Shared fixtures. The app reads its configuration at import time, so the
+environment is set up before `app` is imported: a throwaway SQLite database,
+the lease-free scheduler mode and no response cache.
+"""
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix='medicine-tests-')
+os.environ.update({
+    'DATABASE_URL': f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}",
+    'SCHEDULER_MODE': 'always',
+    'EMBEDDED_SCHEDULER': '0',
+    'RESPONSE_CACHE_SIZE': '0',
+})
+
+import pytest
+
+import app as medicine_app
+
+
+@pytest.fixture
+def db():
+    """A fresh schema for each test, inside an app context"""
+    with medicine_app.app.app_context():
+        medicine_app.db.drop_all()
+        medicine_app.db.create_all()
+        yield medicine_app.db
+        medicine_app.db.session.remove()
+
+
+@pytest.fixture
+def client(db):
+    return medicine_app.app.test_client()
+
+
+@pytest.fixture
+def login(client):
+    """Register and log in a user; returns their id"""
+    def login_as(username='patient'):
+        password = 'secret123'
+        client.post('/api/register', json={
+            'username': username, 'email': f'{username}@example.com',
+            'password': password, 'confirm_password': password
+        })
+        response = client.post('/api/login', json={'email': f'{username}@example.com', 'password': password})
+        assert response.get_json()['success']
+        return medicine_app.User.query.filter_by(username=username).one().id
+    return login_as
+
+
+@pytest.fixture
+def add_medicine(client):
+    """Add a medicine for the logged-in user; returns its id"""
+    def add(name='Aspirin', times=('08:00',), frequency='daily', start_date='2024-01-01', **fields):
+        response = client.post('/api/add_medicine', json={
+            'medicine_name': name, 'dosage': '10mg', 'frequency': frequency,
+            'specific_times': list(times), 'start_date': start_date, **fields
+        })
+        assert response.get_json()['success'], response.get_json()
+        return medicine_app.Medicine.query.filter_by(medicine_name=name).order_by(medicine_app.Medicine.id.desc()).first().id
+    return add
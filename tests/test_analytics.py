@@ -0,0 +1,25 @@
+from datetime import datetime, timedelta
+
+import app as medicine_app
+from app import MedicineLog
+
+
+def add_log(db, user_id, medicine_id, taken_time, status):
+    db.session.add(MedicineLog(user_id=user_id, medicine_id=medicine_id, taken_time=taken_time,
+                               scheduled_time='08:00', status=status))
+    db.session.commit()
+
+
+def test_future_logs_are_ignored(db, login, add_medicine):
+    user_id = login()
+    medicine_id = add_medicine(times=('08:00',))
+    today = datetime.combine(datetime.utcnow().date(), datetime.min.time())
+    for days_ago in range(1, 4):
+        add_log(db, user_id, medicine_id, today - timedelta(days=days_ago) + timedelta(hours=8), 'Taken')
+    expected = medicine_app.compute_adherence_analytics({user_id})
+
+    # e.g. a bad import: Missed doses dated next week
+    add_log(db, user_id, medicine_id, today + timedelta(days=5, hours=8), 'Missed')
+    add_log(db, user_id, medicine_id, today + timedelta(days=400, hours=8), 'Missed')
+
+    assert medicine_app.compute_adherence_analytics({user_id}) == expected
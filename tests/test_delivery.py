@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from pywebpush import WebPushException
+
+import app as medicine_app
+from app import OutboxMessage, PushSubscription
+
+
+def queue_reminder(db, monkeypatch, user_id, channels):
+    monkeypatch.setattr(medicine_app, 'DELIVERY_CHANNELS', channels)
+    medicine_app.insert_notifications([{
+        'user_id': user_id, 'medicine_id': None, 'message': 'Time to take Aspirin',
+        'type': 'reminder', 'is_read': False, 'created_at': medicine_app.datetime.utcnow()
+    }])
+    db.session.commit()
+
+
+def dispatch_once():
+    """One dispatcher round: claim in its own app context, deliver on threads, save"""
+    with medicine_app.app.app_context():
+        claimed = medicine_app.claim_outbox_messages(10)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(zip(claimed, pool.map(medicine_app.deliver_message, claimed)))
+    with medicine_app.app.app_context():
+        medicine_app.save_delivery_results(results)
+    return results
+
+
+def test_webpush_delivers_to_each_subscription(db, login, monkeypatch):
+    user_id = login()
+    db.session.add_all([
+        PushSubscription(user_id=user_id, endpoint='https://push.example/a', p256dh='key-a', auth='auth-a'),
+        PushSubscription(user_id=user_id, endpoint='https://push.example/b', p256dh='key-b', auth='auth-b'),
+    ])
+    db.session.commit()
+    queue_reminder(db, monkeypatch, user_id, ['webpush', 'stub'])
+
+    sent = []
+    monkeypatch.setattr(medicine_app, 'webpush', lambda subscription_info, **kwargs: sent.append(subscription_info))
+    monkeypatch.setenv('VAPID_PRIVATE_KEY', 'test-key')
+
+    results = dispatch_once()
+
+    assert [error for _, error in results] == [None, None]
+    assert sorted(sent, key=lambda info: info['endpoint']) == [
+        {'endpoint': 'https://push.example/a', 'keys': {'p256dh': 'key-a', 'auth': 'auth-a'}},
+        {'endpoint': 'https://push.example/b', 'keys': {'p256dh': 'key-b', 'auth': 'auth-b'}},
+    ]
+    db.session.expire_all()
+    assert {message.status for message in OutboxMessage.query} == {'sent'}
+
+
+def test_webpush_drops_expired_subscriptions(db, login, monkeypatch):
+    user_id = login()
+    db.session.add(PushSubscription(user_id=user_id, endpoint='https://push.example/gone', p256dh='k', auth='a'))
+    db.session.commit()
+    queue_reminder(db, monkeypatch, user_id, ['webpush'])
+
+    def gone(subscription_info, **kwargs):
+        raise WebPushException('Gone', response=SimpleNamespace(status_code=410))
+    monkeypatch.setattr(medicine_app, 'webpush', gone)
+    monkeypatch.setenv('VAPID_PRIVATE_KEY', 'test-key')
+
+    [(_, error)] = dispatch_once()
+
+    assert error is None
+    assert PushSubscription.query.count() == 0
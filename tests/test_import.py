@@ -0,0 +1,40 @@
+import json
+
+from app import Medicine, MedicineLog
+
+
+def post_ndjson(client, kind, rows):
+    body = '\n'.join(json.dumps(row) for row in rows)
+    return client.post(f'/api/import/{kind}', data=body, content_type='application/x-ndjson').get_json()
+
+
+def test_medicine_rows_with_bad_end_date_or_long_fields_are_skipped(db, client, login):
+    login()
+    valid = {'medicine_name': 'Aspirin', 'dosage': '1 tablet', 'schedule': '08:00', 'start_date': '2024-01-01'}
+    result = post_ndjson(client, 'medicines', [
+        valid,
+        {**valid, 'end_date': 'next year'},
+        {**valid, 'end_date': '2024-12-31' * 10},
+        {**valid, 'priority': 'High' * 10},
+        {**valid, 'end_date': '2024-12-31'},
+    ])
+
+    assert result['success'] is True
+    assert result['imported'] == 2
+    assert [error['line'] for error in result['errors']] == [2, 3, 4]
+    assert sorted(str(end_date) for (end_date,) in db.session.query(Medicine.end_date)) == ['2024-12-31', 'None']
+
+
+def test_log_rows_with_long_scheduled_time_are_skipped(db, client, login, add_medicine):
+    login()
+    medicine_id = add_medicine()
+    result = post_ndjson(client, 'logs', [
+        {'medicine_id': medicine_id, 'taken_time': '2024-03-01T08:00:00', 'scheduled_time': '08:00'},
+        {'medicine_id': medicine_id, 'taken_time': '2024-03-02T08:00:00', 'scheduled_time': '08:00' * 20},
+        {'medicine_id': medicine_id, 'taken_time': '2024-03-03T08:00:00'},
+    ])
+
+    assert result['success'] is True
+    assert result['imported'] == 2
+    assert result['errors'] == [{'line': 2, 'message': 'Invalid scheduled_time'}]
+    assert db.session.query(MedicineLog).count() == 2
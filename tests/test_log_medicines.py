@@ -0,0 +1,53 @@
+import pytest
+
+import app as medicine_app
+
+
+def log_count():
+    return medicine_app.MedicineLog.query.count()
+
+
+def test_string_medicine_id_is_accepted(client, login, add_medicine):
+    login()
+    medicine_id = add_medicine()
+
+    response = client.post('/api/log_medicines', json={'logs': [
+        {'medicine_id': str(medicine_id), 'scheduled_time': '08:00'},
+        {'medicine_id': medicine_id, 'scheduled_time': '20:00', 'status': 'Skipped'},
+    ]})
+
+    assert response.get_json()['success'], response.get_json()
+    assert log_count() == 2
+
+
+@pytest.mark.parametrize('bad_entry, message', [
+    ({'medicine_id': 'abc', 'scheduled_time': '08:00'}, 'Entry 2: Invalid medicine_id'),
+    ({'scheduled_time': '08:00'}, 'Entry 2: Invalid medicine_id'),
+    ({'medicine_id': 999, 'scheduled_time': '08:00'}, 'Entry 2: Medicine not found'),
+    ({'medicine_id': '{id}', 'scheduled_time': '08:00', 'status': 'Eaten'}, 'Entry 2: Invalid status: Eaten'),
+    ({'medicine_id': '{id}'}, 'Entry 2: scheduled_time is required'),
+    ({'medicine_id': '{id}', 'scheduled_time': 'x' * 51}, 'Entry 2: Invalid scheduled_time'),
+    ('not an entry', 'Entry 2: Invalid log entry'),
+])
+def test_bad_entry_rejects_the_batch(client, login, add_medicine, bad_entry, message):
+    login()
+    medicine_id = add_medicine()
+    if isinstance(bad_entry, dict) and bad_entry.get('medicine_id') == '{id}':
+        bad_entry['medicine_id'] = medicine_id
+
+    response = client.post('/api/log_medicines', json={'logs': [
+        {'medicine_id': medicine_id, 'scheduled_time': '08:00'},
+        bad_entry,
+    ]})
+
+    assert response.get_json() == {'success': False, 'message': message}
+    assert log_count() == 0
+
+
+def test_single_log_error_has_no_entry_number(client, login, add_medicine):
+    login()
+    medicine_id = add_medicine()
+
+    response = client.post('/api/log_medicine', json={'medicine_id': medicine_id, 'status': 'Eaten', 'scheduled_time': '08:00'})
+
+    assert response.get_json() == {'success': False, 'message': 'Invalid status: Eaten'}
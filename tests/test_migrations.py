@@ -0,0 +1,87 @@
+"""Upgrading a database created by the original release: only the four
+original tables, none of the indexes or columns the migrations add.
+"""
+import json
+
+from sqlalchemy import inspect, text
+
+import app as medicine_app
+
+BASELINE_SCHEMA = [
+    """CREATE TABLE users (
+        id INTEGER PRIMARY KEY, username VARCHAR(100) NOT NULL UNIQUE,
+        password VARCHAR(200) NOT NULL, email VARCHAR(100) NOT NULL UNIQUE,
+        phone VARCHAR(20), role VARCHAR(20), created_at DATETIME)""",
+    """CREATE TABLE medicines (
+        id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id),
+        medicine_name VARCHAR(100) NOT NULL, dosage VARCHAR(100) NOT NULL,
+        frequency VARCHAR(50) NOT NULL, schedule_type VARCHAR(20), times_per_day INTEGER,
+        specific_times TEXT, start_date VARCHAR(50) NOT NULL, end_date VARCHAR(50),
+        instructions TEXT, status VARCHAR(20), priority VARCHAR(20), created_at DATETIME)""",
+    """CREATE TABLE medicine_logs (
+        id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id),
+        medicine_id INTEGER NOT NULL REFERENCES medicines (id), taken_time DATETIME,
+        scheduled_time VARCHAR(50) NOT NULL, status VARCHAR(20), notes TEXT)""",
+    """CREATE TABLE notifications (
+        id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL REFERENCES users (id),
+        medicine_id INTEGER REFERENCES medicines (id), message TEXT NOT NULL,
+        type VARCHAR(50), is_read BOOLEAN, created_at DATETIME)""",
+]
+
+
+def create_baseline_database(db):
+    db.drop_all()
+    with db.engine.begin() as connection:
+        for statement in BASELINE_SCHEMA:
+            connection.execute(text(statement))
+        connection.execute(text(
+            "INSERT INTO users (id, username, password, email, role, created_at) "
+            "VALUES (1, 'patient', 'x', 'patient@example.com', 'user', '2024-01-01 00:00:00')"
+        ))
+        connection.execute(text(
+            "INSERT INTO medicines (id, user_id, medicine_name, dosage, frequency, times_per_day, "
+            "specific_times, start_date, status, created_at) VALUES "
+            "(1, 1, 'Aspirin', '10mg', 'daily', 2, :times, '2024-01-01', 'Active', '2024-01-01 00:00:00'), "
+            "(2, 1, 'Vitamin D', '1000IU', 'daily', 1, NULL, '2024-01-01', 'Inactive', '2024-01-01 00:00:00')"
+        ), {'times': json.dumps(['08:00', '20:30'])})
+        connection.execute(text(
+            "INSERT INTO medicine_logs (user_id, medicine_id, taken_time, scheduled_time, status) VALUES "
+            "(1, 1, '2024-03-09 08:05:00', '08:00', 'Taken'), "
+            "(1, 1, '2024-03-09 21:00:00', '20:30', 'Missed'), "
+            "(1, 1, '2024-03-10 08:02:00', '08:00', 'Taken')"
+        ))
+
+
+def test_init_db_upgrades_a_baseline_database(db):
+    create_baseline_database(db)
+
+    medicine_app.init_database(max_retries=1)
+
+    inspector = inspect(db.engine)
+    indexes = {index['name'] for table in ('medicines', 'medicine_logs', 'notifications') for index in inspector.get_indexes(table)}
+    expected = {index.name for table in db.metadata.sorted_tables for index in table.indexes if table.name in ('medicines', 'medicine_logs', 'notifications')}
+    assert expected <= indexes
+    assert 'schedule_minutes' in {column['name'] for column in inspector.get_columns('medicines')}
+
+    applied = db.session.query(medicine_app.SchemaMigration.version).all()
+    assert sorted(version for version, in applied) == [version for version, _, _ in medicine_app.MIGRATIONS]
+
+    aspirin, vitamin = db.session.get(medicine_app.Medicine, 1), db.session.get(medicine_app.Medicine, 2)
+    assert aspirin.schedule_minutes == [8 * 60, 20 * 60 + 30]
+    assert vitamin.schedule_minutes == medicine_app.default_schedule(1)
+
+    adherence = {(row.day.isoformat(), row.taken, row.missed) for row in medicine_app.DailyAdherence.query}
+    assert adherence == {('2024-03-09', 1, 1), ('2024-03-10', 1, 0)}
+    counters = db.session.get(medicine_app.UserCounters, 1)
+    assert (counters.medicines, counters.active_medicines) == (2, 1)
+
+    slots = {(row.medicine_id, row.slot_minute) for row in medicine_app.MedicineSlot.query}
+    assert slots == {(1, 8 * 60), (1, 20 * 60 + 30)}
+
+
+def test_migrations_run_once(db):
+    create_baseline_database(db)
+    db.create_all()
+
+    assert medicine_app.run_migrations() == [version for version, _, _ in medicine_app.MIGRATIONS]
+    assert medicine_app.run_migrations() == []
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+import pytest
+
+import app as medicine_app
+from app import Medicine, MedicineLog
+
+
+class FrozenDatetime(datetime):
+    now_value = datetime(2024, 3, 10, 10, 30)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now_value
+
+
+@pytest.fixture
+def medicine(db, login, add_medicine, monkeypatch):
+    """A daily medicine at 08:00 and 09:00; the job runs at 10:30 on 2024-03-10"""
+    def create(times=('08:00', '09:00')):
+        user_id = login()
+        medicine_id = add_medicine(times=times, start_date='2024-03-01')
+        db.session.get(Medicine, medicine_id).created_at = datetime(2024, 3, 1)
+        db.session.commit()
+        monkeypatch.setattr(medicine_app, 'datetime', FrozenDatetime)
+        return user_id, medicine_id
+    return create
+
+
+def add_log(db, user_id, medicine_id, taken_time, scheduled_time='', status='Taken'):
+    db.session.add(MedicineLog(user_id=user_id, medicine_id=medicine_id, taken_time=taken_time,
+                               scheduled_time=scheduled_time, status=status))
+    db.session.commit()
+
+
+def missed_times(medicine_id):
+    return sorted(log.scheduled_time for log in MedicineLog.query.filter_by(medicine_id=medicine_id, status='Missed'))
+
+
+def test_one_log_covers_one_dose(db, medicine):
+    user_id, medicine_id = medicine()
+    add_log(db, user_id, medicine_id, datetime(2024, 3, 10, 8, 5), scheduled_time='8:05:12 AM')
+
+    assert medicine_app.detect_missed_doses() == 1
+    assert missed_times(medicine_id) == ['09:00']
+    assert medicine_app.detect_missed_doses() == 0  # already logged as missed
+
+
+def test_late_log_counts_for_the_dose_it_names(db, medicine):
+    user_id, medicine_id = medicine()
+    add_log(db, user_id, medicine_id, datetime(2024, 3, 10, 8, 40), scheduled_time='08:00')
+
+    assert medicine_app.detect_missed_doses() == 1
+    assert missed_times(medicine_id) == ['09:00']
+
+
+def test_missed_log_does_not_cover_a_later_dose(db, medicine):
+    user_id, medicine_id = medicine(times=('07:00', '09:00'))
+    # Left by an earlier run of the job, stamped at slot time
+    add_log(db, user_id, medicine_id, datetime(2024, 3, 10, 7, 0), scheduled_time='07:00', status='Missed')
+
+    assert medicine_app.detect_missed_doses() == 1
+    assert missed_times(medicine_id) == ['07:00', '09:00']
+
+
+def test_every_dose_logged(db, medicine):
+    user_id, medicine_id = medicine()
+    add_log(db, user_id, medicine_id, datetime(2024, 3, 10, 7, 55))
+    add_log(db, user_id, medicine_id, datetime(2024, 3, 10, 9, 20))
+
+    assert medicine_app.detect_missed_doses() == 0
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+import app as medicine_app
+
+
+def add_reminders(db, user_id, count):
+    now = datetime.utcnow()
+    db.session.add_all([
+        medicine_app.Notification(user_id=user_id, message=f'Reminder {i}', type='reminder', is_read=False, created_at=now)
+        for i in range(count)
+    ])
+    db.session.commit()
+    return [n.id for n in medicine_app.Notification.query.filter_by(user_id=user_id, type='reminder').order_by(medicine_app.Notification.id)]
+
+
+def test_every_read_path_returns_the_unread_count(db, client, login):
+    user_id = login()
+    first, second, third, fourth = add_reminders(db, user_id, 4)
+
+    synced = client.get('/api/sync_notifications').get_json()
+    assert (synced['last_id'], synced['unread_count']) == (fourth, 4)
+
+    assert client.post(f'/api/mark_notification_read/{first}').get_json()['unread_count'] == 3
+    assert client.post('/api/mark_notifications_read', json={'ids': [second]}).get_json()['unread_count'] == 2
+    assert client.post('/api/mark_all_notifications_read', json={'up_to_id': third}).get_json()['unread_count'] == 1
+
+    delta = client.get(f'/api/sync_notifications?after_id={fourth}').get_json()
+    assert (delta['notifications'], delta['last_id'], delta['unread_count']) == ([], fourth, 1)
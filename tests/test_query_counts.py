@@ -0,0 +1,35 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+
+@contextmanager
+def count_queries(engine):
+    statements = []
+    record = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def medicines_query_count(client, db):
+    with count_queries(db.engine) as statements:
+        response = client.get('/api/user_medicines')
+    assert response.get_json()['success']
+    return len(statements), len(response.get_json()['medicines'])
+
+
+def test_user_medicines_query_count_does_not_grow_with_medicines(client, db, login, add_medicine):
+    login()
+    add_medicine('Medicine 0')
+    one = medicines_query_count(client, db)
+
+    for i in range(1, 10):
+        add_medicine(f'Medicine {i}', times=('08:00', '20:00'))
+    client.post('/api/log_medicine', json={'medicine_id': 1, 'scheduled_time': '08:00'})
+    many = medicines_query_count(client, db)
+
+    assert one[1] == 1 and many[1] == 10
+    assert many[0] == one[0]
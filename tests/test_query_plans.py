@@ -0,0 +1,62 @@
+"""The hot read paths must be served from an index: EXPLAIN QUERY PLAN for
+each statement a request runs against medicine_logs or notifications may
+SEARCH those tables but never SCAN them.
+"""
+import pytest
+from sqlalchemy import event
+
+HOT_TABLES = ('medicine_logs', 'notifications')
+
+
+def captured_statements(db, client, url):
+    statements = []
+    record = lambda conn, cursor, statement, parameters, *args: statements.append((statement, parameters))
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+    assert response.get_json()['success']
+    return [
+        (statement, parameters) for statement, parameters in statements
+        if statement.lstrip().upper().startswith('SELECT') and any(table in statement for table in HOT_TABLES)
+    ]
+
+
+def full_scans(db, statement, parameters):
+    with db.engine.connect() as connection:
+        plan = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', parameters).all()
+    details = [row[-1] for row in plan]
+    return [detail for detail in details if any(detail.startswith(f'SCAN {table}') for table in HOT_TABLES)], details
+
+
+@pytest.fixture
+def history(client, login, add_medicine):
+    login()
+    medicine_id = add_medicine(times=('08:00', '20:00'))
+    for scheduled_time in ('08:00', '20:00'):
+        client.post('/api/log_medicine', json={'medicine_id': medicine_id, 'scheduled_time': scheduled_time})
+
+
+@pytest.mark.parametrize('url', [
+    '/api/medicine_history',
+    '/api/medicine_history?limit=1',
+    '/api/user_notifications',
+    '/api/sync_notifications',
+    '/api/sync_notifications?after_id=1',
+])
+def test_hot_queries_use_an_index(db, client, history, url):
+    statements = captured_statements(db, client, url)
+    assert statements
+    for statement, parameters in statements:
+        scans, plan = full_scans(db, statement, parameters)
+        assert not scans, f'{statement}\n{plan}'
+
+
+@pytest.mark.parametrize('url', ['/api/medicine_history', '/api/user_notifications'])
+def test_next_page_uses_an_index(db, client, history, url):
+    next_cursor = client.get(f'{url}?limit=1').get_json()['next_cursor']
+    assert next_cursor
+    for statement, parameters in captured_statements(db, client, f'{url}?limit=1&cursor={next_cursor}'):
+        scans, plan = full_scans(db, statement, parameters)
+        assert not scans, f'{statement}\n{plan}'
@@ -0,0 +1,109 @@
+"""Read routing against two SQLite files standing in for a primary and its
+replica. The replica is never synced, so a read that reaches it sees none of
+the primary's rows, which makes where each read went visible in the response.
+"""
+import time
+
+import pytest
+from sqlalchemy import event, inspect
+
+import app as medicine_app
+
+WRITES = ('INSERT', 'UPDATE', 'DELETE', 'CREATE', 'DROP', 'ALTER')
+
+
+@pytest.fixture
+def replica_app(tmp_path, monkeypatch):
+    monkeypatch.setattr(medicine_app, 'DATABASE_URL', f"sqlite:///{tmp_path / 'primary.db'}")
+    monkeypatch.setattr(medicine_app, 'REPLICA_DATABASE_URL', f"sqlite:///{tmp_path / 'replica.db'}")
+    metadatas = dict(medicine_app.db.metadatas)
+    app = medicine_app.create_app()
+    # Only for setup: requests must each get their own app context (and g)
+    with app.app_context():
+        engines = {'primary': medicine_app.db.engine, 'replica': medicine_app.db.engines['replica']}
+    for engine in engines.values():
+        medicine_app.db.metadata.create_all(engine)
+
+    statements = {name: [] for name in engines}
+    for name, engine in engines.items():
+        event.listen(engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args, name=name: statements[name].append(statement))
+    yield app, engines, statements
+    for engine in engines.values():
+        engine.dispose()
+    # init_app registered metadata for the replica bind on the shared db
+    medicine_app.db.metadatas.clear()
+    medicine_app.db.metadatas.update(metadatas)
+
+
+def replica_writes(statements):
+    return [s for s in statements['replica'] if s.lstrip().upper().startswith(WRITES)]
+
+
+def user_medicines(client, statements):
+    for name in statements:
+        statements[name].clear()
+    response = client.get('/api/user_medicines').get_json()
+    assert response['success']
+    return [medicine['medicine_name'] for medicine in response['medicines']]
+
+
+def test_reads_follow_writes_then_move_to_the_replica(replica_app):
+    app, engines, statements = replica_app
+    client = app.test_client()
+    password = 'secret123'
+    client.post('/api/register', json={'username': 'patient', 'email': 'patient@example.com',
+                                       'password': password, 'confirm_password': password})
+    assert client.post('/api/login', json={'email': 'patient@example.com', 'password': password}).get_json()['success']
+    assert client.post('/api/add_medicine', json={
+        'medicine_name': 'Aspirin', 'dosage': '10mg', 'frequency': 'daily',
+        'specific_times': ['08:00'], 'start_date': '2024-01-01'
+    }).get_json()['success']
+
+    # Right after the write: read-your-writes from the primary
+    assert user_medicines(client, statements) == ['Aspirin']
+    assert statements['replica'] == []
+
+    # Once REPLICA_STICKY_SECONDS have passed the same read goes to the (empty) replica
+    with client.session_transaction() as browser_session:
+        browser_session['last_write_at'] = time.time() - medicine_app.REPLICA_STICKY_SECONDS - 1
+    assert user_medicines(client, statements) == []
+    assert statements['replica'] and statements['primary'] == []
+
+    # A write pins the session to the primary again
+    logged = client.post('/api/log_medicine', json={'medicine_id': 1, 'scheduled_time': '08:00'}).get_json()
+    assert logged['success'], logged
+    assert user_medicines(client, statements) == ['Aspirin']
+    assert statements['replica'] == []
+
+
+def test_no_write_reaches_the_replica(replica_app):
+    app, engines, statements = replica_app
+    client = app.test_client()
+    password = 'secret123'
+    client.post('/api/register', json={'username': 'patient', 'email': 'patient@example.com',
+                                       'password': password, 'confirm_password': password})
+    client.post('/api/login', json={'email': 'patient@example.com', 'password': password})
+    client.post('/api/add_medicine', json={
+        'medicine_name': 'Aspirin', 'dosage': '10mg', 'frequency': 'daily',
+        'specific_times': ['08:00'], 'start_date': '2024-01-01'
+    })
+    all_statements = {name: [] for name in statements}
+    with client.session_transaction() as browser_session:
+        browser_session['last_write_at'] = 0
+    for url in ('/api/user_medicines', '/api/stats', '/api/upcoming_reminders', '/api/medicine_history',
+                '/api/user_notifications', '/api/sync_notifications', '/api/adherence_history',
+                '/api/adherence_analytics'):
+        assert client.get(url).get_json()['success'], url
+        for name in statements:
+            all_statements[name] += statements[name]
+            statements[name].clear()
+        with client.session_transaction() as browser_session:
+            browser_session['last_write_at'] = 0
+
+    assert all_statements['replica']
+    assert replica_writes(all_statements) == []
+    replica = engines['replica']
+    with replica.connect() as connection:
+        for table in inspect(replica).get_table_names():
+            assert connection.exec_driver_sql(f'SELECT COUNT(*) FROM {table}').scalar() == 0, table
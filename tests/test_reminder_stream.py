@@ -0,0 +1,149 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+import app as medicine_app
+
+
+def add_reminder(db, user_id):
+    notification = medicine_app.Notification(
+        user_id=user_id, message='Time for Aspirin', type='reminder', is_read=False, created_at=datetime.utcnow()
+    )
+    db.session.add(notification)
+    db.session.commit()
+    return notification.id
+
+
+def read_stream(client, **headers):
+    started = time.monotonic()
+    body = client.get('/api/reminder_stream', headers=headers).get_data(as_text=True)
+    return body, time.monotonic() - started
+
+
+def last_event_id(body):
+    return [line[len('id: '):] for line in body.splitlines() if line.startswith('id: ')][-1]
+
+
+@pytest.fixture
+def listening(monkeypatch):
+    """Pretend this process holds a Postgres LISTEN connection"""
+    monkeypatch.setattr(medicine_app, 'listening', True)
+    monkeypatch.setattr(medicine_app, 'listen_generation', 1)
+    monkeypatch.setattr(medicine_app, 'reminder_wakeups', {})
+    monkeypatch.setattr(medicine_app, 'REMINDER_STREAM_SECONDS', 0.2)
+
+
+@pytest.fixture
+def statements(db):
+    executed = []
+    record = lambda conn, cursor, statement, *args: executed.append(statement)
+    event.listen(db.engine, 'before_cursor_execute', record)
+    yield executed
+    event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def test_stream_ends_after_one_batch(db, client, login):
+    reminder_id = add_reminder(db, login())
+
+    body, elapsed = read_stream(client)
+
+    assert body.startswith(f'retry: {medicine_app.REMINDER_STREAM_RETRY_MS}\n\n')
+    assert f'id: {reminder_id}\nevent: reminders\n' in body
+    assert elapsed < 1
+
+
+def test_stream_ends_at_the_deadline(db, client, login, monkeypatch):
+    reminder_id = add_reminder(db, login())
+    monkeypatch.setattr(medicine_app, 'REMINDER_STREAM_SECONDS', 0.3)
+
+    body, elapsed = read_stream(client, **{'Last-Event-ID': str(reminder_id)})
+
+    assert body == f'retry: {medicine_app.REMINDER_STREAM_RETRY_MS}\n\nid: {reminder_id}\n\n'
+    assert 0.3 <= elapsed < 2
+    assert medicine_app.reminder_waiters == {}
+
+
+def test_waiting_stream_wakes_for_a_new_reminder(db, client, login, monkeypatch):
+    user_id = login()
+    monkeypatch.setattr(medicine_app, 'REMINDER_STREAM_SECONDS', 5)
+
+    def remind():
+        while user_id not in medicine_app.reminder_waiters:
+            time.sleep(0.01)
+        with medicine_app.app.app_context():
+            add_reminder(medicine_app.db, user_id)
+        medicine_app.wake_reminder_streams([user_id])
+    threading.Thread(target=remind).start()
+
+    body, elapsed = read_stream(client)
+
+    assert 'event: reminders' in body
+    assert elapsed < 3
+
+
+def test_streams_beyond_the_slots_return_at_once(db, client, login, monkeypatch):
+    login()
+    monkeypatch.setattr(medicine_app, 'reminder_stream_slots', threading.BoundedSemaphore(1))
+    medicine_app.reminder_stream_slots.acquire()
+
+    body, elapsed = read_stream(client)
+
+    assert body == f'retry: {medicine_app.REMINDER_STREAM_BUSY_RETRY_MS}\n\nid: 0\n\n'
+    assert elapsed < 1
+
+
+def test_idle_reconnect_with_a_current_token_runs_no_query(db, client, login, listening, statements):
+    login()
+    first, _ = read_stream(client)
+    assert 'event: reminders' not in first
+    statements.clear()
+
+    body, _ = read_stream(client, **{'Last-Event-ID': last_event_id(first)})
+
+    assert statements == []
+    assert last_event_id(body) == last_event_id(first)
+
+    # Tabs over the slot limit skip it too
+    busy = threading.BoundedSemaphore(1)
+    busy.acquire()
+    medicine_app.reminder_stream_slots, slots = busy, medicine_app.reminder_stream_slots
+    try:
+        body, elapsed = read_stream(client, **{'Last-Event-ID': last_event_id(first)})
+    finally:
+        medicine_app.reminder_stream_slots = slots
+    assert statements == [] and elapsed < 1
+
+
+def test_reconnect_after_a_wakeup_queries(db, client, login, listening, statements):
+    user_id = login()
+    first, _ = read_stream(client)
+    reminder_id = add_reminder(db, user_id)
+    medicine_app.wake_reminder_streams([user_id])  # what the NOTIFY listener does
+    statements.clear()
+
+    body, _ = read_stream(client, **{'Last-Event-ID': last_event_id(first)})
+
+    assert statements
+    assert f'id: {reminder_id}-' in body and 'event: reminders' in body
+
+
+@pytest.mark.parametrize('change', ['listener_reconnected', 'listener_down', 'other_process'])
+def test_token_from_another_listener_or_process_is_not_trusted(db, client, login, listening, statements, change):
+    login()
+    token = last_event_id(read_stream(client)[0])
+    if change == 'listener_reconnected':
+        medicine_app.listen_generation += 1
+    elif change == 'listener_down':
+        medicine_app.listening = False
+    else:
+        last_id, _, rest = token.partition('-')
+        pid, _, rest = rest.partition('.')
+        token = f'{last_id}-{int(pid) + 1}.{rest}'
+    statements.clear()
+
+    read_stream(client, **{'Last-Event-ID': token})
+
+    assert statements
@@ -0,0 +1,97 @@
+import heapq
+from datetime import datetime
+
+import pytest
+
+import app as medicine_app
+from app import Notification, SchedulerWatermark
+
+
+class FrozenDatetime(datetime):
+    now_value = datetime(2024, 3, 11, 8, 0, 30)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.now_value
+
+
+@pytest.fixture
+def clock(db, monkeypatch):
+    """Freezes the app's clock at 08:00:30 on 2024-03-11, with an empty fire queue"""
+    monkeypatch.setattr(FrozenDatetime, 'now_value', datetime(2024, 3, 11, 8, 0, 30))
+    monkeypatch.setattr(medicine_app, 'datetime', FrozenDatetime)
+    monkeypatch.setattr(medicine_app, 'fire_queue', [])
+    monkeypatch.setattr(medicine_app, 'queued_minutes', set())
+    return FrozenDatetime
+
+
+def set_watermark(db, processed_until):
+    db.session.add(SchedulerWatermark(name='reminders', processed_until=processed_until))
+    db.session.commit()
+
+
+def watermark(db):
+    db.session.expire_all()
+    return db.session.get(SchedulerWatermark, 'reminders').processed_until
+
+
+def reminder_messages():
+    return sorted(n.message for n in Notification.query.filter_by(type='reminder'))
+
+
+def queue(slot_minute, fire_at):
+    """Queue a minute as already due (adding a medicine would queue its next day)"""
+    heapq.heappush(medicine_app.fire_queue, (fire_at, slot_minute))
+    medicine_app.queued_minutes.add(slot_minute)
+
+
+def test_minute_stays_queued_when_the_watermark_is_already_current(db, clock, login, add_medicine):
+    login()
+    queue(8 * 60, datetime(2024, 3, 11, 8, 0))
+    add_medicine(times=('08:00',))
+    set_watermark(db, datetime(2024, 3, 11, 8, 0))  # another process already fired 08:00
+
+    medicine_app.fire_due_reminders()
+
+    assert medicine_app.queued_minutes == {8 * 60}
+    assert medicine_app.fire_queue == [(datetime(2024, 3, 12, 8, 0), 8 * 60)]
+    assert reminder_messages() == []
+
+
+def test_minute_with_no_active_medicines_drops_out_once_fired(db, clock, login, add_medicine):
+    login()
+    queue(8 * 60, datetime(2024, 3, 11, 8, 0))
+    queue(8 * 60 + 1, datetime(2024, 3, 11, 8, 1))  # its medicine was removed
+    add_medicine(times=('08:00',))
+    set_watermark(db, datetime(2024, 3, 11, 7, 59))
+    clock.now_value = datetime(2024, 3, 11, 8, 1, 30)
+
+    medicine_app.fire_due_reminders()
+
+    assert medicine_app.queued_minutes == {8 * 60}
+    assert medicine_app.fire_queue == [(datetime(2024, 3, 12, 8, 0), 8 * 60)]
+    assert len(reminder_messages()) == 1
+
+
+def test_catch_up_fires_each_missed_slot_once(db, clock, login, add_medicine):
+    login()
+    add_medicine('Before', times=('06:59', '07:00'))
+    add_medicine('Missed', times=('07:01', '07:40'))
+    add_medicine('Now', times=('08:00',))
+    add_medicine('Later', times=('08:01',))
+    set_watermark(db, datetime(2024, 3, 11, 7, 0))
+
+    fired, active = medicine_app.run_reminder_tick()
+
+    # (07:00, 08:00] in 15-minute batches
+    assert len(fired) == 60
+    assert active == {7 * 60 + 1, 7 * 60 + 40, 8 * 60}
+    assert watermark(db) == datetime(2024, 3, 11, 8, 0)
+    messages = reminder_messages()
+    assert len(messages) == 3
+    assert [any(f'Time to take {name} ' in message for message in messages) for name in ('Missed', 'Now', 'Before', 'Later')] \
+        == [True, True, False, False]
+    assert sum('Missed' in message for message in messages) == 2
+
+    assert medicine_app.run_reminder_tick() == (set(), set())
+    assert reminder_messages() == messages
@@ -0,0 +1,29 @@
+from collections import OrderedDict
+
+import pytest
+
+import app as medicine_app
+
+
+@pytest.fixture
+def response_cache(monkeypatch):
+    monkeypatch.setattr(medicine_app, 'RESPONSE_CACHE_SIZE', 100)
+    monkeypatch.setattr(medicine_app, 'response_cache', OrderedDict())
+    return medicine_app.response_cache
+
+
+def test_failures_are_not_cached(client, login, add_medicine, response_cache, monkeypatch):
+    login()
+    add_medicine()
+
+    def fail(user_ids):
+        raise RuntimeError('database went away')
+    with monkeypatch.context() as patch:
+        patch.setattr(medicine_app, 'compute_adherence_analytics', fail)
+        assert client.get('/api/adherence_analytics').get_json()['success'] is False
+    assert response_cache == {}
+
+    # The next request recomputes, and that success is cached
+    assert client.get('/api/adherence_analytics').get_json()['success'] is True
+    assert len(response_cache) == 1
+    assert client.get('/api/adherence_analytics').get_json()['success'] is True
@@ -0,0 +1,33 @@
+import os
+
+import app as medicine_app
+
+
+def in_forked_child(fn):
+    """Run fn() in a child forked from this (already imported) process; returns its output"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, str(fn()).encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    with os.fdopen(read_fd) as pipe:
+        return pipe.read()
+
+
+def test_forked_workers_do_not_share_the_scheduler_lease(db, monkeypatch):
+    # gunicorn --preload imports the app once and forks every worker from it
+    monkeypatch.setattr(medicine_app, 'SCHEDULER_MODE', 'lease')
+    assert medicine_app.acquire_scheduler_lease()
+
+    def child_acquires():
+        db.engine.dispose(close=False)  # don't reuse the parent's connections
+        with medicine_app.app.app_context():
+            return medicine_app.acquire_scheduler_lease()
+
+    assert in_forked_child(child_acquires) == 'False'
+    assert in_forked_child(medicine_app.scheduler_owner) != medicine_app.scheduler_owner()
+    assert medicine_app.acquire_scheduler_lease()  # the holder still renews
@@ -0,0 +1,24 @@
+import re
+from pathlib import Path
+
+SW_SOURCE = (Path(__file__).resolve().parent.parent / 'static' / 'sw.js').read_text()
+
+
+def precached_urls():
+    urls_block = re.search(r'const urlsToCache = \[(.*?)\];', SW_SOURCE, re.S).group(1)
+    return re.findall(r"'([^']+)'", urls_block)
+
+
+def test_service_worker_is_served_from_the_root_scope(client):
+    response = client.get('/sw.js')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/javascript'
+
+
+def test_every_precached_url_resolves(client):
+    # cache.addAll rejects on any non-2xx, which aborts the worker's install
+    urls = precached_urls()
+    assert urls
+    for url in urls:
+        assert client.get(url).status_code == 200, url
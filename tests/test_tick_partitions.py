@@ -0,0 +1,80 @@
+"""The partitioned tick must send exactly what the in-process tick sends,
+both partition by partition and through the spawn worker pool it ships with.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+import pytest
+
+import app as medicine_app
+
+SLOT_DATES = {8 * 60: date(2024, 3, 11), 8 * 60 + 30: date(2024, 3, 11)}  # a Monday
+PARTITIONS = 4
+
+
+@pytest.fixture
+def schedules(client, login, add_medicine):
+    for number in range(6):
+        login(f'patient{number}')
+        add_medicine(f'Aspirin {number}', times=('08:00', '08:30', '20:00'))
+        if number % 2:
+            add_medicine(f'Vitamin D {number}', times=('08:30',))
+        # Weekly on Sundays: due on neither slot's date
+        add_medicine(f'Methotrexate {number}', times=('08:00',), frequency='weekly', start_date='2024-03-10')
+        client.get('/api/logout')
+
+
+def sent_reminders():
+    return sorted(
+        (n.user_id, n.medicine_id, n.message)
+        for n in medicine_app.Notification.query.filter_by(type='reminder')
+    )
+
+
+def reset_reminders(db):
+    for model in (medicine_app.OutboxMessage, medicine_app.ReminderDispatch):
+        db.session.query(model).delete()
+    db.session.query(medicine_app.Notification).filter_by(type='reminder').delete()
+    db.session.commit()
+
+
+def summary(report):
+    return {key: report[key] for key in ('active_minutes', 'due', 'sent', 'user_ids')}
+
+
+@pytest.fixture
+def in_process(db, schedules):
+    report = medicine_app.send_slot_reminders(SLOT_DATES)
+    reminders = sent_reminders()
+    reset_reminders(db)
+    assert report['sent'] == len(reminders) == 6 * 2 + 3
+    return summary(report), reminders
+
+
+def test_partitions_match_the_in_process_tick(db, in_process):
+    reports = [medicine_app.send_slot_reminders(SLOT_DATES, (index, PARTITIONS)) for index in range(PARTITIONS)]
+
+    assert summary(medicine_app.merge_tick_reports(reports)) == in_process[0]
+    assert sent_reminders() == in_process[1]
+    assert all(report['sent'] for report in reports)
+
+
+def test_worker_pool_matches_the_in_process_tick(db, in_process, monkeypatch):
+    pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn'))
+    reports = []
+    real_merge = medicine_app.merge_tick_reports
+    monkeypatch.setattr(medicine_app, 'get_tick_pool', lambda: pool)
+    monkeypatch.setattr(medicine_app, 'SCHEDULER_TICK_PARTITIONS', PARTITIONS)
+    monkeypatch.setattr(medicine_app, 'merge_tick_reports', lambda parts: reports.append(real_merge(parts)) or reports[-1])
+    try:
+        fired, active_minutes = medicine_app.check_medicine_reminders(dict(SLOT_DATES))
+    finally:
+        pool.shutdown()
+
+    db.session.expire_all()
+    assert fired == set(SLOT_DATES)
+    assert active_minutes == in_process[0]['active_minutes']
+    assert reports[0]['partitions'] == PARTITIONS
+    assert summary(reports[0]) == in_process[0]
+    assert sent_reminders() == in_process[1]